@@ -0,0 +1,562 @@
+import os
+import json
+import time
+import heapq
+import hashlib
+from datetime import datetime
+import pandas as pd
+from WantedCrawling import setup_driver, extract_company_profile_links, extract_company_profile_data, preprocess_text_data
+
+class TokenBucket:
+    """
+    Token bucket limiting how many page loads can be made in a time window
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum number of tokens (burst size)
+        tokens: Initial number of tokens (default: capacity)
+        clock: Function returning the current time in seconds (default: time.time)
+        sleep: Function used to wait for tokens (default: time.sleep)
+    """
+
+    # Tolerance on the token count so that float rounding in the refill cannot
+    # leave acquire() sleeping for ever smaller amounts of time
+    EPSILON = 1e-9
+
+    def __init__(self, rate, capacity, tokens=None, clock=time.time, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity if tokens is None else tokens
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self):
+        """Seconds until one token is available (0 if available now)"""
+        self._refill()
+        if self.tokens >= 1 - self.EPSILON:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until one token is available and consume it"""
+        wait = self.wait_time()
+        while wait > 0:
+            self.sleep(wait)
+            wait = self.wait_time()
+        self.tokens = max(0.0, self.tokens - 1)
+
+class AdaptiveBackoff:
+    """
+    Extra delay between page loads that grows on errors or slow responses and decays on success
+
+    Args:
+        base_delay: Delay after a normal response in seconds (default: 1.0)
+        max_delay: Upper bound of the delay in seconds (default: 300)
+        factor: Multiplier applied on every error or slow response (default: 2.0)
+        slow_threshold: Page load time in seconds above which a response counts as slow (default: 10)
+    """
+
+    def __init__(self, base_delay=1.0, max_delay=300.0, factor=2.0, slow_threshold=10.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.slow_threshold = slow_threshold
+        self.delay = base_delay
+
+    def record(self, elapsed, success):
+        """
+        Update the delay after a page load
+
+        Args:
+            elapsed: Page load time in seconds (see page_load_time)
+            success: Whether the page load returned usable data
+
+        Returns:
+            The delay to wait before the next page load
+        """
+        if not success or elapsed > self.slow_threshold:
+            self.delay = min(self.max_delay, self.delay * self.factor)
+        else:
+            # Recover gradually so that one good response does not undo a long outage
+            self.delay = max(self.base_delay, self.delay / self.factor)
+        return self.delay
+
+# Fixed sleeps inside extract_company_profile_data when the content button is found and clicked
+# (3 + 2 + 2 + 1 + 1 + 1; the timeout fallback adds another 2s)
+EXTRACTION_FIXED_WAIT = 10.0
+
+def driver_is_alive(driver):
+    """
+    Check whether a WebDriver still responds
+
+    extract_company_profile_data swallows its errors, so an empty result alone does not
+    tell a closed posting from a crashed browser. A dead session raises on any command.
+
+    Args:
+        driver: Selenium WebDriver instance
+
+    Returns:
+        True if the driver executed a trivial script
+    """
+    try:
+        driver.execute_script("return 1;")
+        return True
+    except Exception:
+        return False
+
+def page_load_time(driver, elapsed, fixed_wait=EXTRACTION_FIXED_WAIT):
+    """
+    Load time of the page currently open in the driver, excluding the extraction's own waits
+
+    The extraction functions sleep and wait for elements after driver.get, so the wall
+    time of a call says little about how fast the server responded. The browser's
+    navigation timing is used instead; if it is unavailable, the known fixed sleeps are
+    subtracted from the wall time.
+
+    Args:
+        driver: Selenium WebDriver instance
+        elapsed: Wall time of the extraction call in seconds (used as fallback)
+        fixed_wait: Fixed sleeps contained in elapsed (default: EXTRACTION_FIXED_WAIT)
+
+    Returns:
+        Page load time in seconds
+    """
+    try:
+        load_ms = driver.execute_script("""
+            var nav = performance.getEntriesByType('navigation')[0];
+            if (nav && nav.duration) return nav.duration;
+            var t = performance.timing;
+            return t.loadEventEnd - t.navigationStart;
+        """)
+        if load_ms and load_ms > 0:
+            return load_ms / 1000.0
+    except Exception:
+        pass
+    return max(0.0, elapsed - fixed_wait)
+
+def content_hash(extracted_data):
+    """
+    Hash the part of extract_company_profile_data's result that matters for change detection
+
+    Args:
+        extracted_data: Dictionary returned by extract_company_profile_data
+
+    Returns:
+        Hex digest string
+    """
+    payload = json.dumps({
+        'company_name': extracted_data.get('company_name'),
+        'category_data': extracted_data.get('category_data', {}),
+    }, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+class CrawlScheduler:
+    """
+    Long-running crawler that re-visits company profile pages in priority order
+
+    Every URL is scheduled for its next visit from two signals:
+    - change rate: exponentially weighted share of past visits on which the content changed
+    - freshness: postings first seen recently are visited more often than old ones
+
+    Page loads are limited by a per-minute and a per-hour token bucket and slowed down
+    further by AdaptiveBackoff when pages load slowly or the seed page fails. A profile
+    page that comes back empty (e.g. a closed posting) only counts against that URL: it
+    is retried with a growing delay and parked after max_url_failures empty visits in a
+    row. When the WebDriver itself stops responding, it is restarted once and the page
+    load is not charged to the URL; if the new driver dies too before any page loads,
+    the run stops. State (including the token buckets) is saved to a JSON file so that
+    the scheduler can be stopped and resumed without resetting the budget.
+
+    Args:
+        seed_url: Listing page used to discover new company profile links
+        state_file: JSON file holding the per-URL crawl state (default: 'crawl_state.json')
+        output_file: CSV file receiving one row per new or changed profile (default: 'crawl_results.csv')
+        requests_per_minute: Page loads per minute, also the burst size (default: 6)
+        requests_per_hour: Hourly budget; any hour holds at most requests_per_hour + hourly_burst
+                           page loads (default: 200)
+        hourly_burst: Burst capacity of the hourly bucket (default: 6)
+        min_interval: Minimum time between visits of the same URL in seconds (default: 6 hours)
+        max_interval: Maximum time between visits of the same URL in seconds (default: 14 days)
+        freshness_half_life: Age in seconds after which a posting's freshness boost halves (default: 3 days)
+        discover_interval: Time between link discovery runs on seed_url in seconds (default: 6 hours)
+        max_links: Maximum number of links collected per discovery run (default: 30)
+        change_smoothing: Weight of the latest visit in the change rate (default: 0.3)
+        max_url_failures: Empty visits in a row after which a URL is parked and no longer
+                          crawled (default: 3)
+        backoff: Optional AdaptiveBackoff instance
+        clock: Function returning the current time in seconds (default: time.time)
+        sleep: Function used to wait (default: time.sleep)
+    """
+
+    def __init__(self, seed_url, state_file='crawl_state.json', output_file='crawl_results.csv',
+                 requests_per_minute=6, requests_per_hour=200, hourly_burst=6, min_interval=6 * 3600,
+                 max_interval=14 * 24 * 3600, freshness_half_life=3 * 24 * 3600,
+                 discover_interval=6 * 3600, max_links=30, change_smoothing=0.3,
+                 max_url_failures=3, backoff=None, clock=time.time, sleep=time.sleep):
+        self.seed_url = seed_url
+        self.state_file = state_file
+        self.output_file = output_file
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.freshness_half_life = freshness_half_life
+        self.discover_interval = discover_interval
+        self.max_links = max_links
+        self.change_smoothing = change_smoothing
+        self.max_url_failures = max_url_failures
+        self.clock = clock
+        self.sleep = sleep
+
+        self.buckets = [
+            TokenBucket(requests_per_minute / 60.0, max(1, requests_per_minute), clock=clock, sleep=sleep),
+            TokenBucket(requests_per_hour / 3600.0, max(1, hourly_burst), clock=clock, sleep=sleep),
+        ]
+        self.backoff = backoff or AdaptiveBackoff()
+
+        self.state = {}
+        self.last_discovery = None
+        self.queue = []
+        # Page loads paid for with tokens since this instance was created
+        self.page_loads = 0
+        # Set when the WebDriver stopped responding; run() restarts it
+        self.driver_dead = False
+        # Whether the WebDriver was restarted since the last page load on a live driver
+        self.driver_restarted = False
+        self.load_state()
+
+    # ----------------- State persistence -----------------
+
+    def load_state(self):
+        """Load the per-URL state from state_file and rebuild the priority queue"""
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                self.state = saved.get('urls', {})
+                self.last_discovery = saved.get('last_discovery')
+                for bucket, bucket_state in zip(self.buckets, saved.get('buckets', [])):
+                    bucket.tokens = min(bucket.capacity, bucket_state['tokens'])
+                    bucket.updated_at = bucket_state['updated_at']
+                print(f"✓ Loaded crawl state for {len(self.state)} URLs from {self.state_file}")
+            except Exception as e:
+                print(f"⚠ Could not read crawl state {self.state_file}: {e}")
+                self.state = {}
+
+        self.queue = []
+        for url in self.state:
+            self.schedule(url)
+
+    def save_state(self):
+        """Write the per-URL state to state_file (via a temporary file so a crash cannot corrupt it)"""
+        tmp_file = self.state_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'last_discovery': self.last_discovery,
+                'buckets': [{'tokens': bucket.tokens, 'updated_at': bucket.updated_at} for bucket in self.buckets],
+                'urls': self.state,
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    # ----------------- Scheduling -----------------
+
+    def add_url(self, url):
+        """
+        Register a company profile URL; new URLs are scheduled immediately
+
+        Returns:
+            True if the URL was not known before
+        """
+        if url in self.state:
+            return False
+        self.state[url] = {
+            'company_name': None,
+            'first_seen': self.clock(),
+            'last_crawled': None,
+            'last_changed': None,
+            'change_rate': 1.0,  # Assume a new posting changes until we know better
+            'content_hash': None,
+            'crawl_count': 0,
+            'failures': 0,
+            'parked': False,
+        }
+        self.schedule(url)
+        return True
+
+    def freshness(self, url):
+        """Freshness between 0 and 1: 1 for a posting first seen just now, halving every freshness_half_life"""
+        age = max(0.0, self.clock() - self.state[url]['first_seen'])
+        return 0.5 ** (age / self.freshness_half_life)
+
+    def revisit_interval(self, url):
+        """
+        Time between two visits of a URL in seconds
+
+        Interpolates geometrically between max_interval (never changes, old posting) and
+        min_interval (always changes or brand new posting). Failed visits are retried
+        after an exponentially growing delay instead.
+        """
+        entry = self.state[url]
+        if entry['failures']:
+            return min(self.max_interval, self.min_interval * 2 ** (entry['failures'] - 1))
+
+        urgency = max(entry['change_rate'], self.freshness(url))
+        return self.max_interval * (self.min_interval / self.max_interval) ** urgency
+
+    def next_visit(self, url):
+        """Timestamp at which a URL should be visited next"""
+        entry = self.state[url]
+        if entry['last_crawled'] is None:
+            return entry['first_seen']
+        return entry['last_crawled'] + self.revisit_interval(url)
+
+    def schedule(self, url):
+        """Push a URL onto the priority queue at its next visit time (parked URLs are left out)"""
+        if self.state[url].get('parked'):
+            self.state[url]['next_visit'] = None
+            return
+        due = self.next_visit(url)
+        self.state[url]['next_visit'] = due
+        heapq.heappush(self.queue, (due, url))
+
+    def pop_due_url(self):
+        """
+        Pop the URL that is due first
+
+        Returns:
+            Tuple (due_time, url), or None if nothing is scheduled
+        """
+        while self.queue:
+            due, url = heapq.heappop(self.queue)
+            # Skip stale entries left behind when a URL was rescheduled
+            if url in self.state and due == self.state[url].get('next_visit'):
+                return due, url
+        return None
+
+    # ----------------- Crawling -----------------
+
+    def acquire_request(self):
+        """Wait for every token bucket to grant a page load"""
+        for bucket in self.buckets:
+            bucket.acquire()
+        self.page_loads += 1
+
+    def discover(self, driver):
+        """Collect company profile links from seed_url and register the new ones"""
+        self.acquire_request()
+        start = self.clock()
+        try:
+            links = extract_company_profile_links(driver, self.seed_url, max_links=self.max_links)
+        except Exception as e:
+            print(f"  ⚠ Error during link discovery: {e}")
+            links = []
+        # extract_company_profile_links sleeps at least 3s after loading the page
+        load_time = page_load_time(driver, self.clock() - start, fixed_wait=3.0)
+        delay = self.backoff.record(load_time, bool(links))
+
+        if not links and not driver_is_alive(driver):
+            # Leave last_discovery untouched so discovery runs again after the restart
+            self.driver_dead = True
+            return delay
+        self.driver_restarted = False
+
+        new_count = sum(self.add_url(link) for link in links)
+        self.last_discovery = self.clock()
+        print(f"✓ Discovery: {len(links)} links, {new_count} new (tracking {len(self.state)} URLs)")
+        return delay
+
+    def crawl(self, driver, url):
+        """
+        Visit one company profile page, update its change statistics and reschedule it
+
+        Returns:
+            The backoff delay to wait before the next page load
+        """
+        entry = self.state[url]
+        previous = {key: entry[key] for key in ('last_crawled', 'crawl_count', 'failures')}
+        try:
+            self.acquire_request()
+            start = self.clock()
+            entry['last_crawled'] = start
+            entry['crawl_count'] += 1
+            extracted_data = extract_company_profile_data(driver, url)
+            load_time = page_load_time(driver, self.clock() - start)
+            success = bool(extracted_data.get('category_data'))
+
+            if not success and not driver_is_alive(driver):
+                # The browser died, not the page: retry the URL after the restart without charging it
+                entry.update(previous)
+                self.driver_dead = True
+                print("    ⚠ WebDriver is not responding")
+                return self.backoff.record(load_time, False)
+            self.driver_restarted = False
+
+            # An empty page is a property of the URL (e.g. a closed posting), not of the site,
+            # so it is handled per URL and only slow page loads feed the shared backoff
+            delay = self.backoff.record(load_time, True)
+            entry['last_crawled'] = self.clock()
+            if not success:
+                entry['failures'] += 1
+                if entry['failures'] >= self.max_url_failures:
+                    entry['parked'] = True
+                    print(f"    ⚠ No data extracted {entry['failures']} times in a row. URL parked.")
+                else:
+                    print(f"    ⚠ No data extracted (failure {entry['failures']})")
+                return delay
+
+            entry['failures'] = 0
+            new_hash = content_hash(extracted_data)
+            changed = new_hash != entry['content_hash']
+            if entry['content_hash'] is not None:
+                entry['change_rate'] = (1 - self.change_smoothing) * entry['change_rate'] + \
+                                       self.change_smoothing * (1.0 if changed else 0.0)
+            if changed:
+                entry['company_name'] = extracted_data.get('company_name') or entry['company_name']
+                try:
+                    self.write_result(extracted_data)
+                except Exception as e:
+                    # Keep the old hash so the change is written on the next visit
+                    print(f"    ⚠ Could not write to {self.output_file}: {e}")
+                else:
+                    entry['content_hash'] = new_hash
+                    entry['last_changed'] = entry['last_crawled']
+            print(f"    {'✓ Changed' if changed else '  Unchanged'} (change rate {entry['change_rate']:.2f}, "
+                  f"page load {load_time:.1f}s)")
+            return delay
+
+        except Exception:
+            # The page load was paid for, so charge the failure to the URL; otherwise it
+            # would be rescheduled at the same due time and retried immediately
+            if entry['crawl_count'] > previous['crawl_count']:
+                entry['failures'] += 1
+            raise
+
+        finally:
+            # Reschedule even if something above raised, so the URL never drops out of the queue
+            self.schedule(url)
+
+    def write_result(self, extracted_data):
+        """Append one new or changed profile to output_file in the same columns as WantedCrawling.main"""
+        category_data = extracted_data.get('category_data', {})
+        row_df = pd.DataFrame([{
+            '기업명': extracted_data.get('company_name') or 'N/A',
+            '주요업무': category_data.get('주요업무', ''),
+            '자격요건': category_data.get('자격요건', ''),
+            '우대사항': category_data.get('우대사항', ''),
+        }])
+        row_df = preprocess_text_data(row_df)
+        row_df['url'] = extracted_data.get('url')
+        row_df['crawled_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        write_header = not os.path.exists(self.output_file)
+        row_df.to_csv(self.output_file, mode='a', header=write_header, index=False, encoding='utf-8-sig')
+
+    def run(self, max_requests=None, max_runtime=None):
+        """
+        Crawl until interrupted, max_requests page loads or max_runtime seconds
+
+        Args:
+            max_requests: Optional maximum number of page loads
+            max_runtime: Optional maximum runtime in seconds
+
+        Returns:
+            Number of page loads made
+        """
+        start = self.clock()
+        loads_at_start = self.page_loads
+        driver = None
+
+        try:
+            while max_requests is None or self.page_loads - loads_at_start < max_requests:
+                if max_runtime is not None and self.clock() - start >= max_runtime:
+                    break
+
+                try:
+                    if self.driver_dead:
+                        if self.driver_restarted:
+                            print("\n⚠ WebDriver died again right after a restart. Stopping.")
+                            break
+                        print("\n⚠ WebDriver is not responding. Restarting WebDriver...")
+                        if driver:
+                            try:
+                                driver.quit()
+                            except Exception:
+                                pass
+                        driver = None
+                        self.driver_dead = False
+                        self.driver_restarted = True
+
+                    if driver is None:
+                        driver = setup_driver()
+
+                    if self.last_discovery is None or self.clock() - self.last_discovery >= self.discover_interval:
+                        delay = self.discover(driver)
+                    else:
+                        item = self.pop_due_url()
+                        now = self.clock()
+                        next_discovery = (self.last_discovery or now) + self.discover_interval
+                        if item is None or item[0] > now:
+                            # Nothing due yet: sleep until the next visit or discovery, whichever is first
+                            if item is not None:
+                                heapq.heappush(self.queue, item)
+                            wake_up = min(item[0] if item else next_discovery, next_discovery)
+                            self.sleep(min(max(1.0, wake_up - now), 60.0))
+                            continue
+
+                        due, url = item
+                        entry = self.state[url]
+                        print(f"\n[{self.page_loads - loads_at_start + 1}] {entry['company_name'] or url} "
+                              f"(overdue {max(0.0, now - due) / 60:.0f} min)")
+                        delay = self.crawl(driver, url)
+
+                    self.save_state()
+
+                except Exception as e:
+                    # Log and keep going: a long-running scheduler must survive single failures
+                    print(f"  ⚠ Error in crawl loop: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    if driver is not None and not driver_is_alive(driver):
+                        self.driver_dead = True
+                    delay = self.backoff.record(0.0, False)
+
+                self.sleep(delay)
+
+        except KeyboardInterrupt:
+            print("\nInterrupted. Saving crawl state...")
+
+        finally:
+            self.save_state()
+            if driver:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                print("WebDriver closed.")
+
+        requests_made = self.page_loads - loads_at_start
+        print(f"✓ {requests_made} page loads in {(self.clock() - start) / 60:.1f} min. "
+              f"State saved to {self.state_file}")
+        return requests_made
+
+def main():
+    """Run the crawl scheduler until interrupted with Ctrl+C"""
+    url = input("Please enter the Wanted.co.kr URL to discover company profiles from: ").strip()
+
+    if not url:
+        print("No URL provided. Using default URL...")
+        url = "https://www.wanted.co.kr"
+
+    print("=" * 60)
+    print("Crawl Scheduler - press Ctrl+C to stop (state is saved)")
+    print("=" * 60)
+
+    scheduler = CrawlScheduler(url)
+    scheduler.run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+from SkillNetworkRendering import build_incidence_matrix, build_skill_cooccurrence, degree_centrality
+
+# Curriculum / competency spellings mapped onto the skill names used in the job postings
+# (keys and values are normalized with normalize_skill). Only one-to-one synonyms belong
+# here: broad concepts such as 'Data Analysis' or 'Generative AI' have no single posting
+# skill, and 'Network' in the postings means computer networking, not network analysis.
+SKILL_ALIASES = {
+    '머신러닝': 'ml',
+    'machine learning': 'ml',
+    'deep learning': 'dl',
+    'artificial intelligence': 'ai',
+    'ai models': 'ai',
+    'apache spark': 'spark',
+    'statistical analysis': 'statistics',
+    'query': 'sql',
+    'crawling': 'crawler',
+    'text mining': 'nlp',
+}
+
+def normalize_skill(name):
+    """
+    Normalize a skill name so that curriculum, competency and job posting spellings match
+
+    Args:
+        name: Raw skill name
+
+    Returns:
+        Lower-cased, whitespace-normalized skill name with SKILL_ALIASES applied
+    """
+    key = ' '.join(str(name).split()).lower()
+    return SKILL_ALIASES.get(key, key)
+
+def load_curriculum_skills(file_name, unit_col='수업명', skill_col='스킬'):
+    """
+    Load the course -> skills table (e.g. '학과 Skill.csv') as a long edge list
+
+    Args:
+        file_name: CSV with one row per course and a comma-separated skill list
+        unit_col: Column holding the course name (default: '수업명')
+        skill_col: Column holding the comma-separated skills (default: '스킬')
+
+    Returns:
+        pandas DataFrame with columns ['단위', 'Skill'], one row per (course, skill).
+        Courses without skills are kept with an empty skill so that they still get scored.
+    """
+    df = pd.read_csv(file_name, encoding='utf-8-sig')
+    df[skill_col] = df[skill_col].fillna('').astype(str).str.split(',')
+    df = df.explode(skill_col)
+    df[skill_col] = df[skill_col].str.strip()
+    return df.rename(columns={unit_col: '단위', skill_col: 'Skill'})[['단위', 'Skill']]
+
+def load_competency_categories(file_name, skill_col='Competency', category_col='Category'):
+    """
+    Load the competency -> category table (e.g. 'competencies_by_category_eng.csv') as a long edge list
+
+    Args:
+        file_name: CSV with one row per competency
+        skill_col: Column holding the competency name (default: 'Competency')
+        category_col: Column holding the category name (default: 'Category')
+
+    Returns:
+        pandas DataFrame with columns ['단위', 'Skill'], one row per (category, competency)
+    """
+    df = pd.read_csv(file_name, encoding='utf-8-sig')
+    return df.rename(columns={category_col: '단위', skill_col: 'Skill'})[['단위', 'Skill']]
+
+def build_job_family_matrices(family_files, extra_skills=()):
+    """
+    Build job family x skill demand and importance matrices from the bipartite edge lists
+
+    Args:
+        family_files: Dictionary {job family name: bipartite edge list CSV with ['기업명', 'Skill']}
+        extra_skills: Skill names taught by the curriculum; those never seen in the postings
+                      are appended to the vocabulary with zero demand
+
+    Returns:
+        Tuple (families, skill_keys, skill_names, demand, importance):
+        - families: List of job family names in row order
+        - skill_keys: List of normalized skill names in column order
+        - skill_names: Dictionary {normalized skill: first spelling seen in the postings}
+        - demand: numpy array (n_families, n_skills), share of the family's companies requiring the skill
+        - importance: numpy array (n_families, n_skills), demand x degree centrality of the skill
+                      in the family's projected skill network
+    """
+    families = list(family_files)
+    skill_names = {}
+    per_family = []
+
+    for family in families:
+        df_edges = pd.read_csv(family_files[family], encoding='utf-8-sig')
+        df_edges['Skill'] = df_edges['Skill'].astype(str).str.strip()
+        for name in df_edges['Skill'].unique():
+            skill_names.setdefault(normalize_skill(name), name)
+        df_edges['Skill'] = df_edges['Skill'].map(normalize_skill)
+
+        incidence, companies, skills = build_incidence_matrix(df_edges)
+        centrality = degree_centrality(build_skill_cooccurrence(incidence))
+        per_family.append((skills, incidence.mean(axis=0), centrality))
+
+    for name in extra_skills:
+        skill_names.setdefault(normalize_skill(name), name)
+
+    skill_keys = list(skill_names)
+    column = {skill: j for j, skill in enumerate(skill_keys)}
+    demand = np.zeros((len(families), len(skill_keys)))
+    importance = np.zeros((len(families), len(skill_keys)))
+    for i, (skills, family_demand, centrality) in enumerate(per_family):
+        idx = np.array([column[skill] for skill in skills], dtype=np.int64)
+        demand[i, idx] = family_demand
+        importance[i, idx] = family_demand * centrality
+
+    return families, skill_keys, skill_names, demand, importance
+
+def build_unit_matrix(df_units, skill_keys):
+    """
+    Build a unit x skill matrix (course x skill or category x skill) on a fixed skill vocabulary
+
+    Skills missing from skill_keys are ignored, so pass the unit skills to
+    build_job_family_matrices as extra_skills first.
+
+    Args:
+        df_units: pandas DataFrame with columns ['단위', 'Skill']
+        skill_keys: List of normalized skill names (columns of the demand matrix)
+
+    Returns:
+        Tuple (units, matrix):
+        - units: List of unit names in row order (including units without any skill)
+        - matrix: numpy array (n_units, n_skills), 1.0 where the unit covers the skill
+    """
+    units = list(pd.unique(df_units['단위']))
+    row = {unit: i for i, unit in enumerate(units)}
+    column = {skill: j for j, skill in enumerate(skill_keys)}
+
+    matrix = np.zeros((len(units), len(skill_keys)))
+    for unit, skill in zip(df_units['단위'], df_units['Skill']):
+        if pd.isna(skill) or not str(skill).strip():
+            continue
+        j = column.get(normalize_skill(skill))
+        if j is not None:
+            matrix[row[unit], j] = 1.0
+
+    return units, matrix
+
+def score_skill_gaps(unit_matrix, demand, importance, top_k=30):
+    """
+    Score every unit against every job family in one matrix pass
+
+    Args:
+        unit_matrix: numpy array (n_units, n_skills), see build_unit_matrix
+        demand: numpy array (n_families, n_skills), see build_job_family_matrices
+        importance: numpy array (n_families, n_skills), see build_job_family_matrices
+        top_k: Number of most demanded skills per family used for coverage (default: 30)
+
+    Returns:
+        Dictionary of numpy arrays of shape (n_units, n_families):
+        - 'coverage': demand-weighted share of the family's top_k most demanded skills the unit covers
+        - 'relevance': share of the unit's skills that the job family asks for at all
+        - 'demand_weighted_gap': share of the family's total skill demand the unit does not cover
+        - 'importance': share of the family's centrality-weighted importance the unit covers
+    """
+    unit_size = unit_matrix.sum(axis=1, keepdims=True)
+    demanded = (demand > 0).astype(np.float64)
+
+    # Keep only each family's top_k demanded skills
+    top_k = min(top_k, demand.shape[1])
+    top_demand = np.zeros_like(demand)
+    if top_k > 0:
+        top = np.argpartition(demand, -top_k, axis=1)[:, -top_k:]
+        rows = np.arange(demand.shape[0])[:, None]
+        top_demand[rows, top] = demand[rows, top]
+
+    coverage = (unit_matrix @ top_demand.T) / np.maximum(top_demand.sum(axis=1), 1e-12)
+    relevance = np.divide(unit_matrix @ demanded.T, unit_size,
+                          out=np.zeros((unit_matrix.shape[0], demand.shape[0])), where=unit_size > 0)
+    covered_demand = (unit_matrix @ demand.T) / np.maximum(demand.sum(axis=1), 1e-12)
+    covered_importance = (unit_matrix @ importance.T) / np.maximum(importance.sum(axis=1), 1e-12)
+
+    return {
+        'coverage': coverage,
+        'relevance': relevance,
+        'demand_weighted_gap': 1.0 - covered_demand,
+        'importance': covered_importance,
+    }
+
+def matched_skill_share(unit_matrix, demand):
+    """
+    Share of each unit's skills that any job family asks for
+
+    A low score can mean a real gap or just that the unit's skills are spelled differently
+    from the postings; this separates the two.
+
+    Args:
+        unit_matrix: numpy array (n_units, n_skills), see build_unit_matrix
+        demand: numpy array (n_families, n_skills), see build_job_family_matrices
+
+    Returns:
+        numpy array (n_units,), NaN for units without any skill
+    """
+    unit_size = unit_matrix.sum(axis=1)
+    matched = unit_matrix @ (demand.sum(axis=0) > 0).astype(np.float64)
+    return np.divide(matched, unit_size, out=np.full(unit_matrix.shape[0], np.nan), where=unit_size > 0)
+
+def top_gap_skills(unit_row, demand_row, skill_keys, skill_names, n=10):
+    """
+    List the most demanded skills a unit does not cover for one job family
+
+    Args:
+        unit_row: numpy array (n_skills,), one row of the unit matrix
+        demand_row: numpy array (n_skills,), one row of the demand matrix
+        skill_keys: List of normalized skill names
+        skill_names: Dictionary {normalized skill: display name}
+        n: Number of skills to return (default: 10)
+
+    Returns:
+        List of (skill name, demand share) tuples, highest demand first
+    """
+    gap = demand_row * (1.0 - unit_row)
+    top = np.argsort(gap)[::-1][:n]
+    return [(skill_names[skill_keys[j]], float(gap[j])) for j in top if gap[j] > 0]
+
+def score_curriculum(family_files, curriculum_file=None, competency_file=None, department_name='학과 전체',
+                     top_k=30):
+    """
+    Score the curriculum courses, the whole department and the competency categories
+    against all job families
+
+    Args:
+        family_files: Dictionary {job family name: bipartite edge list CSV}
+        curriculum_file: Optional course -> skills CSV (e.g. '학과 Skill.csv')
+        competency_file: Optional competency -> category CSV (e.g. 'competencies_by_category_eng.csv')
+        department_name: Row name for the union of all courses (default: '학과 전체')
+        top_k: Number of most demanded skills per family used for coverage (default: 30)
+
+    Returns:
+        pandas DataFrame with columns ['구분', '단위', '직군', 'coverage', 'relevance',
+        'demand_weighted_gap', 'importance', 'matched_skill_share', 'top_gap_skills']
+    """
+    df_courses = load_curriculum_skills(curriculum_file) if curriculum_file else None
+    df_categories = load_competency_categories(competency_file) if competency_file else None
+    if df_courses is None and df_categories is None:
+        print("No curriculum or competency file provided. Nothing to score.")
+        return None
+
+    taught = pd.concat([df for df in (df_courses, df_categories) if df is not None])['Skill']
+    taught = [skill for skill in taught.dropna() if str(skill).strip()]
+    families, skill_keys, skill_names, demand, importance = build_job_family_matrices(family_files, taught)
+
+    # Stack every unit into a single matrix so that all of them are scored together
+    kinds, units, blocks = [], [], []
+    if df_courses is not None:
+        course_units, course_matrix = build_unit_matrix(df_courses, skill_keys)
+        kinds += ['학과'] + ['수업'] * len(course_units)
+        units += [department_name] + course_units
+        blocks += [course_matrix.max(axis=0, initial=0)[None, :], course_matrix]
+    if df_categories is not None:
+        category_units, category_matrix = build_unit_matrix(df_categories, skill_keys)
+        kinds += ['역량 카테고리'] * len(category_units)
+        units += category_units
+        blocks.append(category_matrix)
+
+    unit_matrix = np.vstack(blocks)
+    scores = score_skill_gaps(unit_matrix, demand, importance, top_k=top_k)
+    matched_share = matched_skill_share(unit_matrix, demand)
+
+    rows = []
+    for i, (kind, unit) in enumerate(zip(kinds, units)):
+        for f, family in enumerate(families):
+            rows.append({
+                '구분': kind,
+                '단위': unit,
+                '직군': family,
+                'coverage': scores['coverage'][i, f],
+                'relevance': scores['relevance'][i, f],
+                'demand_weighted_gap': scores['demand_weighted_gap'][i, f],
+                'importance': scores['importance'][i, f],
+                'matched_skill_share': matched_share[i],
+                'top_gap_skills': ', '.join(name for name, _ in
+                                            top_gap_skills(unit_matrix[i], demand[f], skill_keys, skill_names, n=5)),
+            })
+
+    # Taught skills without any demand lower the scores of their units; matched_skill_share
+    # shows how much of a unit this affects
+    unmatched = sorted({skill for skill in taught if demand[:, skill_keys.index(normalize_skill(skill))].sum() == 0})
+    if unmatched:
+        print(f"⚠ {len(unmatched)} taught skills match no posting skill (see matched_skill_share):")
+        print(f"  {', '.join(unmatched)}")
+
+    return pd.DataFrame(rows)
+
+def main():
+    """Score the department curriculum and competency categories against the data and developer job families"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    reboot_dir = os.path.join(base_dir, 'SocialNetwork_Reboot')
+
+    family_files = {
+        '데이터 직군': os.path.join(reboot_dir, 'data_bipartite_skill_edges.csv'),
+        '개발자 직군': os.path.join(reboot_dir, 'developer_bipartite_skill_edges.csv'),
+    }
+
+    print("=" * 80)
+    print("Curriculum-to-Market Skill Gap Scoring")
+    print("=" * 80)
+
+    start_time = time.time()
+    result_df = score_curriculum(family_files,
+                                 curriculum_file=os.path.join(reboot_dir, '학과 Skill.csv'),
+                                 competency_file=os.path.join(base_dir, 'competencies_by_category_eng.csv'))
+    print(f"✓ Scored {result_df['단위'].nunique()} units x {result_df['직군'].nunique()} job families "
+          f"in {time.time() - start_time:.2f}s")
+
+    for family, family_df in result_df.groupby('직군', sort=False):
+        print(f"\n--- {family}: Top 10 by centrality-weighted importance ---")
+        top = family_df.sort_values('importance', ascending=False).head(10)
+        for _, row in top.iterrows():
+            print(f"  [{row['구분']}] {row['단위']:30} coverage={row['coverage']:.3f} "
+                  f"relevance={row['relevance']:.3f} gap={row['demand_weighted_gap']:.3f} importance={row['importance']:.3f} "
+                  f"matched={row['matched_skill_share']:.2f}")
+
+        department = family_df[family_df['구분'] == '학과']
+        if not department.empty:
+            print(f"  Largest gaps for the department: {department.iloc[0]['top_gap_skills']}")
+
+    output_file = os.path.join(base_dir, 'skill_gap_scores.csv')
+    result_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    print(f"\n✓ Saved scores to: {output_file}")
+
+    return result_df
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,558 @@
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import matplotlib.font_manager as fm
+from matplotlib.collections import LineCollection
+
+# Multiplier on the default optimal node distance 1/sqrt(n) of force_layout.
+# The dense co-occurrence networks collapse onto their hubs without it.
+K_FACTOR = 3.0
+
+def build_incidence_matrix(df_edges, source='기업명', target='Skill'):
+    """
+    Build a dense company x skill incidence matrix from a bipartite edge list
+
+    Args:
+        df_edges: pandas DataFrame with one row per (company, skill) edge
+        source: Column holding the company names (default: '기업명')
+        target: Column holding the skill names (default: 'Skill')
+
+    Returns:
+        Tuple (incidence, companies, skills):
+        - incidence: numpy array of shape (n_companies, n_skills), 1.0 where the company requires the skill
+        - companies: List of company names in row order
+        - skills: List of skill names in column order
+    """
+    df = df_edges[[source, target]].dropna().drop_duplicates()
+    company_codes, companies = pd.factorize(df[source])
+    skill_codes, skills = pd.factorize(df[target])
+
+    incidence = np.zeros((len(companies), len(skills)), dtype=np.float64)
+    incidence[company_codes, skill_codes] = 1.0
+
+    return incidence, list(companies), list(skills)
+
+def build_skill_cooccurrence(incidence):
+    """
+    Project the company x skill incidence matrix onto a skill x skill network
+
+    Args:
+        incidence: numpy array of shape (n_companies, n_skills)
+
+    Returns:
+        numpy array of shape (n_skills, n_skills) where entry (i, j) is the number of
+        companies requiring both skills i and j (diagonal set to 0)
+    """
+    cooccurrence = incidence.T @ incidence
+    np.fill_diagonal(cooccurrence, 0)
+    return cooccurrence
+
+def degree_centrality(cooccurrence):
+    """
+    Degree centrality of every skill, equivalent to nx.degree_centrality on the projected graph
+
+    Args:
+        cooccurrence: Skill x skill co-occurrence matrix
+
+    Returns:
+        numpy array of shape (n_skills,)
+    """
+    n = cooccurrence.shape[0]
+    if n <= 1:
+        return np.ones(n)
+    return (cooccurrence > 0).sum(axis=1) / (n - 1)
+
+def pagerank_centrality(cooccurrence, alpha=0.85, max_iter=100, tol=1e-6):
+    """
+    Weighted PageRank of every skill using power iteration on the co-occurrence matrix
+
+    Args:
+        cooccurrence: Skill x skill co-occurrence matrix (used as edge weights)
+        alpha: Damping factor (default: 0.85, same as the notebooks)
+        max_iter: Maximum number of power iterations
+        tol: Convergence tolerance on the L1 change of the scores
+
+    Returns:
+        numpy array of shape (n_skills,) summing to 1
+    """
+    n = cooccurrence.shape[0]
+    if n == 0:
+        return np.zeros(0)
+
+    out_weight = cooccurrence.sum(axis=1)
+    dangling = out_weight == 0
+    # Row-normalized transition matrix (dangling rows stay zero and are redistributed below)
+    transition = np.divide(cooccurrence, out_weight[:, None],
+                           out=np.zeros_like(cooccurrence, dtype=np.float64),
+                           where=out_weight[:, None] > 0)
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = scores
+        scores = alpha * (scores @ transition + scores[dangling].sum() / n) + (1 - alpha) / n
+        if np.abs(scores - previous).sum() < n * tol:
+            break
+
+    return scores
+
+def betweenness_centrality(cooccurrence):
+    """
+    Betweenness centrality of every skill, equivalent to nx.betweenness_centrality on the
+    projected graph (unweighted shortest paths, normalized)
+
+    Brandes' algorithm run for all sources at once: every BFS level and every step of the
+    dependency accumulation is one (n_skills x n_skills) matrix product.
+
+    Args:
+        cooccurrence: Skill x skill co-occurrence matrix (only used as adjacency)
+
+    Returns:
+        numpy array of shape (n_skills,)
+    """
+    n = cooccurrence.shape[0]
+    if n <= 2:
+        return np.zeros(n)
+    adjacency = (cooccurrence > 0).astype(np.float64)
+    np.fill_diagonal(adjacency, 0)
+
+    # --- Forward: BFS levels and shortest path counts from every source (rows) ---
+    dist = np.full((n, n), -1, dtype=np.int64)
+    np.fill_diagonal(dist, 0)
+    sigma = np.eye(n)
+    frontier = np.eye(n)
+    depth = 0
+    while True:
+        frontier = frontier @ adjacency
+        frontier[dist >= 0] = 0
+        reached = frontier > 0
+        if not reached.any():
+            break
+        depth += 1
+        dist[reached] = depth
+        sigma += frontier
+
+    # --- Backward: accumulate dependencies from the deepest level up ---
+    delta = np.zeros((n, n))
+    for level in range(depth, 1, -1):
+        coeff = np.where(dist == level, (1 + delta) / np.maximum(sigma, 1), 0)
+        delta += np.where(dist == level - 1, (coeff @ adjacency) * sigma, 0)
+
+    # Every pair is counted from both ends
+    return delta.sum(axis=0) / ((n - 1) * (n - 2))
+
+def filter_edges(cooccurrence, min_weight=1, max_edges=None):
+    """
+    Convert the co-occurrence matrix into edge arrays, keeping only the heavier edges
+
+    Args:
+        cooccurrence: Skill x skill co-occurrence matrix
+        min_weight: Minimum number of shared companies for an edge to be kept (default: 1)
+        max_edges: Optional cap on the number of edges; the heaviest edges are kept
+
+    Returns:
+        Tuple (src, dst, weight) of numpy arrays, one entry per undirected edge
+    """
+    src, dst = np.nonzero(np.triu(cooccurrence, k=1) >= max(min_weight, 1))
+    weight = cooccurrence[src, dst].astype(np.float64)
+
+    if max_edges is not None and len(weight) > max_edges:
+        keep = np.argpartition(weight, -max_edges)[-max_edges:]
+        src, dst, weight = src[keep], dst[keep], weight[keep]
+
+    return src, dst, weight
+
+def _near_field_pairs(cell_x, cell_y, grid_size, near_radius):
+    """
+    Enumerate (i, j) node pairs whose grid cells are within near_radius of each other
+
+    Nodes are bucketed by cell, so only pairs from neighbouring cells are generated
+    instead of all n^2 pairs.
+    """
+    n = len(cell_x)
+    cell_id = cell_x * grid_size + cell_y
+    order = np.argsort(cell_id, kind='stable')
+    counts = np.bincount(cell_id, minlength=grid_size * grid_size)
+    starts = np.cumsum(counts) - counts
+    nodes = np.arange(n)
+
+    pair_i, pair_j = [], []
+    for dx in range(-near_radius, near_radius + 1):
+        for dy in range(-near_radius, near_radius + 1):
+            nx_ = cell_x + dx
+            ny_ = cell_y + dy
+            valid = (nx_ >= 0) & (nx_ < grid_size) & (ny_ >= 0) & (ny_ < grid_size)
+            neighbor_cell = nx_[valid] * grid_size + ny_[valid]
+            cnt = counts[neighbor_cell]
+            total = cnt.sum()
+            if total == 0:
+                continue
+            # Expand every node into one pair per member of its neighbouring cell
+            offset_in_cell = np.arange(total) - np.repeat(np.cumsum(cnt) - cnt, cnt)
+            pair_i.append(np.repeat(nodes[valid], cnt))
+            pair_j.append(order[np.repeat(starts[neighbor_cell], cnt) + offset_in_cell])
+
+    if not pair_i:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    pair_i = np.concatenate(pair_i)
+    pair_j = np.concatenate(pair_j)
+    distinct = pair_i != pair_j
+    return pair_i[distinct], pair_j[distinct]
+
+def rescale_layout(pos, percentile=95):
+    """
+    Center a layout and scale it so that the given percentile of node radii lands at 1
+
+    Unlike scaling by the maximum coordinate, a few far-out nodes cannot shrink the
+    rest of the layout; they simply end up slightly outside [-1, 1].
+
+    Args:
+        pos: numpy array of shape (n_nodes, 2)
+        percentile: Percentile of the distance from the center mapped to 1 (default: 95)
+
+    Returns:
+        Rescaled copy of pos
+    """
+    pos = pos - np.median(pos, axis=0)
+    scale = np.percentile(np.sqrt((pos ** 2).sum(axis=1)), percentile) if len(pos) else 0.0
+    if scale > 0:
+        pos /= scale
+    return pos
+
+def force_layout(n_nodes, src, dst, weight, init_pos=None, iterations=50, k=None,
+                 near_radius=1, initial_temperature=None, seed=42):
+    """
+    Fruchterman-Reingold force layout with a grid-based Barnes-Hut approximation
+
+    Repulsion is computed exactly only for nodes in neighbouring grid cells. Cells
+    further away act as a single mass at their centroid, so each iteration costs
+    roughly O(n^(5/3) + m) instead of the O(n^2) of nx.spring_layout.
+
+    Args:
+        n_nodes: Number of nodes
+        src, dst, weight: Edge arrays (see filter_edges)
+        init_pos: Optional (n_nodes, 2) array of starting positions (e.g. from the layout cache)
+        iterations: Number of iterations (default: 50, same as the notebooks)
+        k: Optimal distance between nodes (default: K_FACTOR/sqrt(n_nodes))
+        near_radius: Number of cell rings around a node whose members repel exactly (default: 1)
+        initial_temperature: Maximum step size of the first iteration
+                             (default: 0.1, or 0.02 when init_pos is given)
+        seed: Random seed for the initial positions
+
+    Returns:
+        numpy array of shape (n_nodes, 2), see rescale_layout
+    """
+    if n_nodes == 0:
+        return np.zeros((0, 2))
+    if n_nodes == 1:
+        return np.zeros((1, 2))
+
+    rng = np.random.default_rng(seed)
+    if init_pos is None:
+        pos = rng.random((n_nodes, 2))
+        if initial_temperature is None:
+            initial_temperature = 0.1
+    else:
+        # Bring cached positions back to the unit square the forces are tuned for
+        pos = rescale_layout(np.asarray(init_pos, dtype=np.float64)) / 2 + 0.5
+        if initial_temperature is None:
+            initial_temperature = 0.02
+
+    if k is None:
+        k = K_FACTOR * np.sqrt(1.0 / n_nodes)
+    k2 = k * k
+
+    src = np.asarray(src)
+    dst = np.asarray(dst)
+    edge_weight = np.asarray(weight, dtype=np.float64)
+    if len(edge_weight):
+        # Log scale so that the few heaviest edges do not pull all hubs onto one spot
+        edge_weight = np.log1p(edge_weight) / np.log1p(edge_weight.max())
+
+    # ForceAtlas2-style node mass: well-connected skills repel each other harder,
+    # so the hubs spread out instead of piling up in the center
+    node_mass = np.bincount(src, minlength=n_nodes) + np.bincount(dst, minlength=n_nodes) + 1.0
+    node_mass = node_mass / node_mass.mean()
+
+    grid_size = max(1, int(np.ceil(n_nodes ** (1.0 / 3.0))))
+    temperature = initial_temperature
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        displacement = np.zeros_like(pos)
+
+        # --- Bucket nodes into a uniform grid over the current bounding box ---
+        lower = pos.min(axis=0)
+        cell_size = max(np.ptp(pos, axis=0).max() / grid_size, 1e-9)
+        cell = np.minimum(((pos - lower) / cell_size).astype(np.int64), grid_size - 1)
+        cell_x, cell_y = cell[:, 0], cell[:, 1]
+
+        # --- Near field: exact repulsion from nodes in neighbouring cells ---
+        pair_i, pair_j = _near_field_pairs(cell_x, cell_y, grid_size, near_radius)
+        delta = pos[pair_i] - pos[pair_j]
+        dist2 = np.maximum((delta ** 2).sum(axis=1), 1e-6)
+        np.add.at(displacement, pair_i, delta * (k2 * node_mass[pair_i] * node_mass[pair_j] / dist2)[:, None])
+
+        # --- Far field: each distant cell repels as one mass at its centroid ---
+        cell_id = cell_x * grid_size + cell_y
+        count = np.bincount(cell_id, minlength=grid_size * grid_size)
+        mass = np.bincount(cell_id, weights=node_mass, minlength=grid_size * grid_size)
+        occupied = np.nonzero(count)[0]
+        centroid = np.stack([
+            np.bincount(cell_id, weights=pos[:, 0], minlength=grid_size * grid_size)[occupied],
+            np.bincount(cell_id, weights=pos[:, 1], minlength=grid_size * grid_size)[occupied],
+        ], axis=1) / count[occupied][:, None]
+        occupied_x, occupied_y = occupied // grid_size, occupied % grid_size
+
+        far = (np.abs(cell_x[:, None] - occupied_x[None, :]) > near_radius) | \
+              (np.abs(cell_y[:, None] - occupied_y[None, :]) > near_radius)
+        delta = pos[:, None, :] - centroid[None, :, :]
+        dist2 = np.maximum((delta ** 2).sum(axis=2), 1e-6)
+        strength = np.where(far, node_mass[:, None] * mass[occupied][None, :] * k2 / dist2, 0.0)
+        displacement += (delta * strength[:, :, None]).sum(axis=1)
+
+        # --- Attraction along edges, scaled by log-normalized edge weight ---
+        if len(src):
+            delta = pos[src] - pos[dst]
+            dist = np.sqrt(np.maximum((delta ** 2).sum(axis=1), 1e-12))
+            pull = delta * (dist * edge_weight / k)[:, None]
+            np.add.at(displacement, src, -pull)
+            np.add.at(displacement, dst, pull)
+
+        # --- Limit the step by the current temperature ---
+        length = np.maximum(np.sqrt((displacement ** 2).sum(axis=1)), 1e-9)
+        pos += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    return rescale_layout(pos)
+
+def load_layout_cache(cache_file):
+    """
+    Load cached node positions
+
+    Args:
+        cache_file: Path of the JSON cache written by save_layout_cache
+
+    Returns:
+        Dictionary {node_name: (x, y)}; empty if the cache does not exist or cannot be read
+    """
+    if not cache_file or not os.path.exists(cache_file):
+        return {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return {node: tuple(xy) for node, xy in json.load(f).items()}
+    except Exception as e:
+        print(f"⚠ Could not read layout cache {cache_file}: {e}")
+        return {}
+
+def save_layout_cache(cache_file, nodes, pos):
+    """
+    Save node positions so that the next run can start from them
+
+    Args:
+        cache_file: Path of the JSON cache
+        nodes: List of node names
+        pos: numpy array of shape (len(nodes), 2)
+    """
+    data = {node: [float(x), float(y)] for node, (x, y) in zip(nodes, pos)}
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+def initial_positions_from_cache(nodes, cache, src, dst, seed=42):
+    """
+    Build starting positions from the layout cache
+
+    Nodes missing from the cache are placed at the mean position of their cached
+    neighbours (or at a random point if none of their neighbours are cached).
+
+    Args:
+        nodes: List of node names
+        cache: Dictionary {node_name: (x, y)} from load_layout_cache
+        src, dst: Edge arrays used to find neighbours of new nodes
+        seed: Random seed for nodes without any cached neighbour
+
+    Returns:
+        numpy array of shape (len(nodes), 2), or None if no node is cached
+    """
+    known = np.array([node in cache for node in nodes], dtype=bool)
+    if not known.any():
+        return None
+
+    pos = np.zeros((len(nodes), 2))
+    pos[known] = [cache[node] for node, is_known in zip(nodes, known) if is_known]
+
+    missing = ~known
+    if missing.any():
+        rng = np.random.default_rng(seed)
+        lower, upper = pos[known].min(axis=0), pos[known].max(axis=0)
+        neighbor_sum = np.zeros_like(pos)
+        neighbor_count = np.zeros(len(nodes))
+        for a, b in ((src, dst), (dst, src)):
+            use = missing[a] & known[b]
+            np.add.at(neighbor_sum, a[use], pos[b[use]])
+            np.add.at(neighbor_count, a[use], 1)
+
+        has_neighbor = missing & (neighbor_count > 0)
+        pos[has_neighbor] = neighbor_sum[has_neighbor] / neighbor_count[has_neighbor][:, None]
+        pos[missing] += rng.normal(scale=0.01, size=(missing.sum(), 2))
+        lonely = missing & (neighbor_count == 0)
+        pos[lonely] = lower + rng.random((lonely.sum(), 2)) * (upper - lower)
+
+    return pos
+
+def set_korean_font():
+    """Use a Korean font for the labels if one is installed (Nanum, AppleGothic or Malgun)"""
+    for font in fm.fontManager.ttflist:
+        if 'Nanum' in font.name or 'AppleGothic' in font.name or 'Malgun' in font.name:
+            plt.rcParams['font.family'] = font.name
+            plt.rcParams['axes.unicode_minus'] = False
+            return font.name
+    return None
+
+def draw_skill_network(skills, pos, src, dst, weight, scores, title, output_file,
+                       figsize=(18, 18), node_scale=750, edge_scale=1.1, top_labels=20,
+                       cmap=plt.cm.YlGnBu):
+    """
+    Draw the skill network from array data and save it as a PNG
+
+    Edges are drawn as one LineCollection instead of one artist per edge. Nodes outside
+    radius 1.1 (see rescale_layout) are pulled onto that circle so that they do not
+    shrink the rest of the drawing.
+
+    Args:
+        skills: List of skill names
+        pos: numpy array of shape (n_skills, 2)
+        src, dst, weight: Edge arrays to draw (already filtered)
+        scores: numpy array of centrality scores used for node size, colour and labels
+        title: Figure title
+        output_file: PNG file name
+        figsize: Figure size (default: (18, 18))
+        node_scale: Multiplier from score to node size (default: 750)
+        edge_scale: Width of the heaviest edge (default: 1.1)
+        top_labels: Number of highest-scoring skills to label (default: 20)
+        cmap: Matplotlib colormap for node colours
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+
+    radius = np.sqrt((pos ** 2).sum(axis=1))
+    pos = pos * (np.minimum(radius, 1.1) / np.maximum(radius, 1e-12))[:, None]
+
+    if len(src):
+        segments = np.stack([pos[src], pos[dst]], axis=1)
+        widths = weight / weight.max() * edge_scale
+        ax.add_collection(LineCollection(segments, colors='gray', alpha=0.6, linewidths=widths, zorder=1))
+
+    ax.scatter(pos[:, 0], pos[:, 1], s=scores * node_scale, c=scores, cmap=cmap, alpha=0.9, zorder=2)
+
+    for i in np.argsort(scores)[::-1][:top_labels]:
+        ax.text(pos[i, 0], pos[i, 1], skills[i], fontsize=10, color='black',
+                ha='center', va='bottom', zorder=3)
+
+    ax.set_title(title, fontsize=20)
+    ax.set_xlim(-1.2, 1.2)
+    ax.set_ylim(-1.2, 1.2)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    fig.savefig(output_file)
+    plt.close(fig)
+
+def render_skill_network(file_name, group_name, title=None, output_file=None, cache_file=None,
+                         centrality='degree', centrality_scores=None, min_weight=2, max_edges=20000,
+                         iterations=50, warm_iterations=15, k=None, **draw_kwargs):
+    """
+    Load a bipartite edge list, lay out the projected skill network and save it as a PNG
+
+    Args:
+        file_name: Bipartite edge list CSV with columns ['기업명', 'Skill']
+        group_name: Name of the job group, used in the default title and file names
+        title: Figure title (default: '{group_name} 스킬 네트워크 ({centrality})')
+        output_file: PNG file name (default: '{group_name}_skill_network.png')
+        cache_file: Layout cache file (default: output_file with '_layout.json' instead of '.png')
+        centrality: 'degree', 'pagerank' or 'betweenness' (ignored when centrality_scores is given)
+        centrality_scores: Optional dictionary {skill: score} computed elsewhere
+        min_weight: Minimum number of shared companies for an edge to be drawn (default: 2)
+        max_edges: Maximum number of edges to draw, heaviest first (default: 20000)
+        iterations: Layout iterations without a cache (default: 50)
+        warm_iterations: Layout iterations when starting from cached positions (default: 15)
+        k: Optimal distance between nodes, passed on to force_layout
+        **draw_kwargs: Passed on to draw_skill_network
+
+    Returns:
+        Dictionary {skill: (x, y)} with the final layout, or None if the file could not be loaded
+    """
+    print(f"\n--- {group_name} 네트워크 렌더링 시작 ---")
+    start_time = time.time()
+
+    try:
+        df_edges = pd.read_csv(file_name, encoding='utf-8-sig')
+    except Exception as e:
+        print(f"❌ 오류: {file_name} 파일 로드 실패. {e}")
+        return None
+
+    if output_file is None:
+        output_file = f'{group_name}_skill_network.png'
+    if cache_file is None:
+        cache_file = os.path.splitext(output_file)[0] + '_layout.json'
+    if title is None:
+        title = f'{group_name} 스킬 네트워크 ({centrality})'
+
+    # 1. Arrays: incidence -> skill co-occurrence
+    incidence, companies, skills = build_incidence_matrix(df_edges)
+    cooccurrence = build_skill_cooccurrence(incidence)
+    all_src, all_dst, all_weight = filter_edges(cooccurrence)
+    print(f"✅ Skill Network 생성 완료: 노드={len(skills)}개, 엣지={len(all_weight)}개")
+
+    # 2. Centrality
+    if centrality_scores is not None:
+        scores = np.array([centrality_scores.get(skill, 0.0) for skill in skills], dtype=np.float64)
+    elif centrality == 'pagerank':
+        scores = pagerank_centrality(cooccurrence)
+        scores = scores / scores.max()
+    elif centrality == 'betweenness':
+        scores = betweenness_centrality(cooccurrence)
+        scores = scores / max(scores.max(), 1e-12)
+        print(f"  Bridge skills (betweenness Top 15): " +
+              ', '.join(f"{skills[i]} ({scores[i]:.2f})" for i in np.argsort(scores)[::-1][:15]))
+    else:
+        scores = degree_centrality(cooccurrence)
+
+    # 3. Layout, warm-started from the cache when available
+    cache = load_layout_cache(cache_file)
+    init_pos = initial_positions_from_cache(skills, cache, all_src, all_dst)
+    if init_pos is None:
+        pos = force_layout(len(skills), all_src, all_dst, all_weight, iterations=iterations, k=k)
+    else:
+        print(f"  Starting from cached layout: {cache_file}")
+        pos = force_layout(len(skills), all_src, all_dst, all_weight, init_pos=init_pos,
+                           iterations=warm_iterations, k=k)
+    save_layout_cache(cache_file, skills, pos)
+
+    # 4. Draw only the heavier edges
+    src, dst, weight = filter_edges(cooccurrence, min_weight=min_weight, max_edges=max_edges)
+    print(f"  Drawing {len(weight)} of {len(all_weight)} edges (weight >= {min_weight})")
+    draw_skill_network(skills, pos, src, dst, weight, scores, title, output_file, **draw_kwargs)
+
+    print(f"✅ {group_name} 네트워크 시각화 파일 저장 완료: {output_file} ({time.time() - start_time:.1f}s)")
+    return {skill: (float(x), float(y)) for skill, (x, y) in zip(skills, pos)}
+
+def main():
+    """Render the data and developer skill networks and the merged bridge skill network in SocialNetwork_Reboot"""
+    set_korean_font()
+    base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SocialNetwork_Reboot')
+
+    render_skill_network(os.path.join(base_dir, 'data_bipartite_skill_edges.csv'), '데이터 직군',
+                         output_file=os.path.join(base_dir, '데이터 직군_skill_network.png'))
+    render_skill_network(os.path.join(base_dir, 'developer_bipartite_skill_edges.csv'), '개발자 직군',
+                         output_file=os.path.join(base_dir, '개발자 직군_skill_network.png'))
+    render_skill_network(os.path.join(base_dir, 'data&developer_bipartite_skill_edges.csv'), '데이터 & 개발자 직군',
+                         title='데이터 & 개발자 직군 통합 스킬 네트워크 (사이중심성)',
+                         output_file=os.path.join(base_dir, 'bridge_skill_analysis_betweenness_centrality_network.png'),
+                         centrality='betweenness', figsize=(20, 20), node_scale=3000, edge_scale=3,
+                         top_labels=30, cmap=plt.cm.RdYlBu)
+
+if __name__ == "__main__":
+    main()
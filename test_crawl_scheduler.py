@@ -0,0 +1,256 @@
+import CrawlScheduler
+from CrawlScheduler import TokenBucket, AdaptiveBackoff, CrawlScheduler as Scheduler
+
+class FakeClock:
+    """Clock whose sleep() advances time instantly"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+class FakeDriver:
+    def __init__(self, alive=True):
+        self.closed = False
+        self.alive = alive
+
+    def execute_script(self, script, *args):
+        if not self.alive:
+            raise RuntimeError("invalid session id")
+        return 500  # 0.5s page load
+
+    def quit(self):
+        self.closed = True
+
+def test_token_bucket_does_not_livelock_on_float_rounding():
+    # At epoch-sized timestamps a tiny sleep no longer advances the clock, so the
+    # refill can get stuck just below one token
+    clock = FakeClock(1.76e9)
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        assert len(sleeps) < 1000, "acquire() is not making progress"
+        clock.sleep(seconds)
+
+    bucket = TokenBucket(200 / 3600.0, 6, clock=clock, sleep=sleep)
+    for i in range(300):
+        sleeps.clear()
+        bucket.acquire()
+        clock.now += (0.0, 1.3, 5.7)[i % 3]
+
+def test_token_bucket_enforces_hourly_budget():
+    clock = FakeClock()
+    bucket = TokenBucket(200 / 3600.0, 6, clock=clock, sleep=clock.sleep)
+    count = 0
+    while True:
+        bucket.acquire()
+        if clock.now - 1_000_000.0 > 3600:
+            break
+        count += 1
+    assert count <= 200 + 6
+
+def test_adaptive_backoff_grows_on_failure_and_slow_pages_and_recovers():
+    backoff = AdaptiveBackoff(base_delay=1.0, max_delay=8.0, factor=2.0, slow_threshold=10.0)
+    assert backoff.record(0.5, False) == 2.0
+    assert backoff.record(12.0, True) == 4.0
+    assert backoff.record(0.5, False) == 8.0
+    assert backoff.record(0.5, False) == 8.0
+    assert backoff.record(0.5, True) == 4.0
+    assert backoff.record(0.5, True) == 2.0
+    assert backoff.record(0.5, True) == 1.0
+    assert backoff.record(0.5, True) == 1.0
+
+def test_bucket_state_survives_restart(tmp_path):
+    clock = FakeClock()
+    state_file = str(tmp_path / 'state.json')
+    scheduler = Scheduler('seed', state_file=state_file, clock=clock, sleep=clock.sleep)
+    for _ in range(6):
+        scheduler.acquire_request()
+    scheduler.save_state()
+
+    restarted = Scheduler('seed', state_file=state_file, clock=clock, sleep=clock.sleep)
+    assert all(bucket.tokens < 1 for bucket in restarted.buckets)
+
+def make_scheduler(tmp_path, clock, **kwargs):
+    return Scheduler('seed', state_file=str(tmp_path / 'state.json'), output_file=str(tmp_path / 'out.csv'),
+                     clock=clock, sleep=clock.sleep, **kwargs)
+
+def test_dead_driver_is_restarted_without_charging_urls(tmp_path, monkeypatch):
+    clock = FakeClock()
+    drivers = []
+
+    def setup_driver():
+        # The first driver dies after link discovery
+        drivers.append(FakeDriver(alive=bool(drivers)))
+        return drivers[-1]
+
+    def extract_data(driver, url):
+        category_data = {'주요업무': 'work'} if driver.alive else {}
+        return {'url': url, 'company_name': url, 'category_data': category_data}
+
+    monkeypatch.setattr(CrawlScheduler, 'setup_driver', setup_driver)
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_links',
+                        lambda driver, url, max_links=30: [f'https://example.com/wd/{i}' for i in range(3)])
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_data', extract_data)
+
+    scheduler = make_scheduler(tmp_path, clock)
+    assert scheduler.run(max_requests=5) == 5
+
+    assert len(drivers) == 2
+    assert drivers[0].closed
+    for entry in scheduler.state.values():
+        assert entry['failures'] == 0
+        assert entry['crawl_count'] == 1
+        assert entry['content_hash'] is not None
+
+def test_driver_dying_again_after_restart_stops_the_run(tmp_path, monkeypatch):
+    clock = FakeClock()
+    drivers = []
+
+    def setup_driver():
+        drivers.append(FakeDriver(alive=False))
+        return drivers[-1]
+
+    monkeypatch.setattr(CrawlScheduler, 'setup_driver', setup_driver)
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_links', lambda driver, url, max_links=30: [])
+
+    scheduler = make_scheduler(tmp_path, clock)
+    assert scheduler.run(max_requests=20) == 2
+    assert len(drivers) == 2
+
+def test_expired_postings_are_parked_without_restarts_or_backoff(tmp_path, monkeypatch):
+    clock = FakeClock()
+    drivers = []
+    urls = [f'https://example.com/wd/{i}' for i in range(12)]
+    expired = set(urls[:9])
+
+    def setup_driver():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    def extract_data(driver, url):
+        category_data = {} if url in expired else {'주요업무': 'work'}
+        return {'url': url, 'company_name': url, 'category_data': category_data}
+
+    monkeypatch.setattr(CrawlScheduler, 'setup_driver', setup_driver)
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_links', lambda driver, url, max_links=30: urls)
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_data', extract_data)
+
+    scheduler = make_scheduler(tmp_path, clock, max_url_failures=3)
+    assert scheduler.run(max_requests=60) == 60
+
+    assert len(drivers) == 1
+    assert scheduler.backoff.delay == scheduler.backoff.base_delay
+    for url in expired:
+        entry = scheduler.state[url]
+        assert entry['parked'] and entry['crawl_count'] == 3
+        assert all(queued_url != url for _, queued_url in scheduler.queue)
+    for url in urls[9:]:
+        assert not scheduler.state[url]['parked']
+
+def test_crawl_error_after_page_load_is_charged_to_the_url(tmp_path, monkeypatch):
+    clock = FakeClock()
+
+    def extract_data(driver, url):
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(CrawlScheduler, 'setup_driver', FakeDriver)
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_links',
+                        lambda driver, url, max_links=30: ['https://example.com/wd/1'])
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_data', extract_data)
+
+    scheduler = make_scheduler(tmp_path, clock, max_url_failures=10)
+    assert scheduler.run(max_requests=3) == 3
+
+    # The failed visit is not retried right away: the next page load is the discovery
+    # six hours later, not the same URL again
+    entry = scheduler.state['https://example.com/wd/1']
+    assert entry['crawl_count'] == 1
+    assert entry['failures'] == 1
+    assert entry['next_visit'] >= entry['last_crawled'] + scheduler.min_interval
+
+def test_changing_url_is_due_before_stable_url(tmp_path):
+    clock = FakeClock()
+    scheduler = make_scheduler(tmp_path, clock)
+    scheduler.add_url('changing')
+    scheduler.add_url('stable')
+
+    # Both postings are old, so only the change rate separates them
+    clock.now += 60 * 24 * 3600
+    for url, rate in (('changing', 0.9), ('stable', 0.1)):
+        scheduler.state[url].update(last_crawled=clock.now, change_rate=rate, content_hash='x')
+        scheduler.schedule(url)
+
+    assert scheduler.revisit_interval('changing') < scheduler.revisit_interval('stable')
+    assert scheduler.pop_due_url()[1] == 'changing'
+
+def test_change_rate_follows_observed_changes(tmp_path, monkeypatch):
+    clock = FakeClock()
+    pages = iter(['a', 'b', 'b', 'b'])
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_data',
+                        lambda driver, url: {'url': url, 'company_name': 'A', 'category_data': {'주요업무': next(pages)}})
+
+    scheduler = make_scheduler(tmp_path, clock, change_smoothing=0.5)
+    scheduler.add_url('url')
+    rates = []
+    for _ in range(4):
+        scheduler.crawl(FakeDriver(), 'url')
+        rates.append(scheduler.state['url']['change_rate'])
+
+    # First visit only records the hash; then changed, unchanged, unchanged
+    assert rates == [1.0, 1.0, 0.5, 0.25]
+
+def test_new_url_is_due_before_old_url(tmp_path):
+    clock = FakeClock()
+    scheduler = make_scheduler(tmp_path, clock)
+    scheduler.add_url('old')
+    clock.now += 30 * 24 * 3600
+    scheduler.add_url('new')
+
+    for url in ('old', 'new'):
+        scheduler.state[url].update(last_crawled=clock.now, change_rate=0.0, content_hash='x')
+        scheduler.schedule(url)
+
+    assert scheduler.freshness('new') == 1.0
+    assert scheduler.freshness('old') < 0.001
+    assert scheduler.revisit_interval('new') == scheduler.min_interval
+    assert scheduler.revisit_interval('old') > 13 * 24 * 3600
+    assert scheduler.pop_due_url()[1] == 'new'
+
+def test_rescheduled_url_skips_its_stale_heap_entry(tmp_path):
+    clock = FakeClock()
+    scheduler = make_scheduler(tmp_path, clock)
+    scheduler.add_url('a')
+    scheduler.add_url('b')
+    clock.now += 1
+
+    # 'a' was visited, so its first heap entry (due at first_seen) is stale
+    scheduler.state['a'].update(last_crawled=clock.now, content_hash='x')
+    scheduler.schedule('a')
+    assert len(scheduler.queue) == 3
+
+    assert scheduler.pop_due_url() == (scheduler.state['b']['next_visit'], 'b')
+    assert scheduler.pop_due_url() == (scheduler.state['a']['next_visit'], 'a')
+    assert scheduler.pop_due_url() is None
+
+def test_failed_result_write_keeps_scheduler_running(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(CrawlScheduler, 'setup_driver', FakeDriver)
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_links',
+                        lambda driver, url, max_links=30: ['https://example.com/wd/1'])
+    monkeypatch.setattr(CrawlScheduler, 'extract_company_profile_data',
+                        lambda driver, url: {'url': url, 'company_name': 'A', 'category_data': {'주요업무': 'work'}})
+
+    # The output directory does not exist, so every write fails
+    scheduler = Scheduler('seed', state_file=str(tmp_path / 'state.json'),
+                          output_file=str(tmp_path / 'missing' / 'out.csv'), clock=clock, sleep=clock.sleep)
+    assert scheduler.run(max_requests=2) == 2
+
+    entry = scheduler.state['https://example.com/wd/1']
+    assert entry['crawl_count'] == 1
+    assert entry['content_hash'] is None
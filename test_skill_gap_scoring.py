@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+from SkillGapScoring import build_unit_matrix, score_skill_gaps, matched_skill_share
+
+# Two job families over four skills; the second family asks for nothing
+DEMAND = np.array([
+    [0.5, 0.3, 0.0, 0.2],
+    [0.0, 0.0, 0.0, 0.0],
+])
+IMPORTANCE = np.array([
+    [0.4, 0.3, 0.0, 0.3],
+    [0.0, 0.0, 0.0, 0.0],
+])
+# Unit 0 covers skills 0 and 2 (skill 2 is not demanded), unit 1 covers skill 1, unit 2 covers nothing
+UNITS = np.array([
+    [1.0, 0.0, 1.0, 0.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.0],
+])
+
+def test_build_unit_matrix_normalizes_and_keeps_empty_units():
+    df_units = pd.DataFrame({
+        '단위': ['course A', 'course A', 'course A', 'course B'],
+        'Skill': ['Machine Learning', ' SQL ', 'Unknown', ''],
+    })
+    units, matrix = build_unit_matrix(df_units, ['ml', 'sql', 'python'])
+
+    assert units == ['course A', 'course B']
+    np.testing.assert_array_equal(matrix, [[1, 1, 0], [0, 0, 0]])
+
+def test_score_skill_gaps_by_hand():
+    scores = score_skill_gaps(UNITS, DEMAND, IMPORTANCE, top_k=2)
+
+    # Top 2 of the first family are skills 0 and 1 with total demand 0.8
+    np.testing.assert_allclose(scores['coverage'][:, 0], [0.5 / 0.8, 0.3 / 0.8, 0.0])
+    np.testing.assert_allclose(scores['relevance'][:, 0], [0.5, 1.0, 0.0])
+    np.testing.assert_allclose(scores['demand_weighted_gap'][:, 0], [0.5, 0.7, 1.0])
+    np.testing.assert_allclose(scores['importance'][:, 0], [0.4, 0.3, 0.0])
+
+def test_score_skill_gaps_top_k_beyond_vocabulary_uses_all_demand():
+    scores = score_skill_gaps(UNITS, DEMAND, IMPORTANCE, top_k=10)
+    np.testing.assert_allclose(scores['coverage'][:, 0], [0.5, 0.3, 0.0])
+
+    scores = score_skill_gaps(UNITS, DEMAND, IMPORTANCE, top_k=0)
+    np.testing.assert_array_equal(scores['coverage'], np.zeros((3, 2)))
+
+def test_score_skill_gaps_zero_demand_family_stays_finite():
+    scores = score_skill_gaps(UNITS, DEMAND, IMPORTANCE, top_k=2)
+    for values in scores.values():
+        assert np.isfinite(values).all()
+    np.testing.assert_array_equal(scores['coverage'][:, 1], 0.0)
+    np.testing.assert_array_equal(scores['relevance'][:, 1], 0.0)
+    np.testing.assert_array_equal(scores['importance'][:, 1], 0.0)
+
+def test_matched_skill_share():
+    share = matched_skill_share(UNITS, DEMAND)
+    np.testing.assert_allclose(share[:2], [0.5, 1.0])
+    assert np.isnan(share[2])
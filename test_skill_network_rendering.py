@@ -0,0 +1,99 @@
+import numpy as np
+from SkillNetworkRendering import (filter_edges, force_layout, betweenness_centrality, load_layout_cache,
+                                   save_layout_cache, initial_positions_from_cache)
+
+def random_graph(n=60, p=0.1, seed=0):
+    rng = np.random.default_rng(seed)
+    upper = np.triu(rng.integers(1, 5, size=(n, n)) * (rng.random((n, n)) < p), k=1)
+    return upper + upper.T
+
+def test_filter_edges_min_weight_and_max_edges():
+    cooccurrence = np.array([
+        [0, 1, 3, 0],
+        [1, 0, 2, 5],
+        [3, 2, 0, 0],
+        [0, 5, 0, 0],
+    ])
+    src, dst, weight = filter_edges(cooccurrence)
+    assert sorted(zip(src, dst, weight)) == [(0, 1, 1), (0, 2, 3), (1, 2, 2), (1, 3, 5)]
+
+    # min_weight below 1 still drops the zero entries
+    assert len(filter_edges(cooccurrence, min_weight=0)[2]) == 4
+
+    src, dst, weight = filter_edges(cooccurrence, min_weight=2)
+    assert sorted(zip(src, dst, weight)) == [(0, 2, 3), (1, 2, 2), (1, 3, 5)]
+
+    src, dst, weight = filter_edges(cooccurrence, min_weight=2, max_edges=2)
+    assert sorted(zip(src, dst, weight)) == [(0, 2, 3), (1, 3, 5)]
+
+def test_force_layout_degenerate_sizes():
+    empty = np.zeros(0, dtype=np.int64)
+    assert force_layout(0, empty, empty, empty).shape == (0, 2)
+    np.testing.assert_array_equal(force_layout(1, empty, empty, empty), [[0.0, 0.0]])
+
+    pos = force_layout(2, np.array([0]), np.array([1]), np.array([1.0]))
+    assert pos.shape == (2, 2) and np.isfinite(pos).all()
+    assert not np.allclose(pos[0], pos[1])
+
+def test_layout_cache_round_trip(tmp_path):
+    cache_file = str(tmp_path / 'layout.json')
+    nodes = ['Python', '파이썬', 'SQL']
+    pos = np.array([[0.1, -0.2], [0.3, 0.4], [-1.0, 0.5]])
+    save_layout_cache(cache_file, nodes, pos)
+
+    cache = load_layout_cache(cache_file)
+    assert list(cache) == nodes
+    np.testing.assert_allclose([cache[node] for node in nodes], pos)
+
+    assert load_layout_cache(str(tmp_path / 'missing.json')) == {}
+    (tmp_path / 'broken.json').write_text('{', encoding='utf-8')
+    assert load_layout_cache(str(tmp_path / 'broken.json')) == {}
+
+def test_initial_positions_from_cache_places_new_nodes_near_cached_neighbours():
+    nodes = ['a', 'b', 'c', 'd']
+    src, dst = np.array([0, 1]), np.array([2, 2])
+    assert initial_positions_from_cache(nodes, {}, src, dst) is None
+
+    cache = {'a': (0.0, 0.0), 'b': (1.0, 0.0), 'x': (5.0, 5.0)}
+    pos = initial_positions_from_cache(nodes, cache, src, dst)
+    np.testing.assert_array_equal(pos[:2], [[0.0, 0.0], [1.0, 0.0]])
+    # 'c' is linked to 'a' and 'b'; 'd' has no cached neighbour and lands inside their bounding box
+    np.testing.assert_allclose(pos[2], [0.5, 0.0], atol=0.05)
+    assert 0.0 <= pos[3, 0] <= 1.0 and pos[3, 1] == 0.0
+
+def test_warm_start_keeps_nodes_near_cached_positions():
+    n = 60
+    src, dst, weight = filter_edges(random_graph(n))
+    cold = force_layout(n, src, dst, weight, iterations=50)
+    warm = force_layout(n, src, dst, weight, init_pos=cold, iterations=15)
+
+    moved = np.sqrt(((warm - cold) ** 2).sum(axis=1))
+    # A cold layout with another seed moves the median node by about 0.9
+    assert np.median(moved) < 0.2
+    assert moved.max() < 0.5
+
+def test_betweenness_centrality_by_hand():
+    # Path a - b - c - d: b and c each lie on 2 of the 3 pairs that do not contain them
+    path = np.array([
+        [0, 1, 0, 0],
+        [1, 0, 1, 0],
+        [0, 1, 0, 1],
+        [0, 0, 1, 0],
+    ])
+    np.testing.assert_allclose(betweenness_centrality(path), [0.0, 2 / 3, 2 / 3, 0.0])
+
+    # Star: the center lies on every shortest path; edge weights do not matter
+    star = np.zeros((5, 5))
+    star[0, 1:] = star[1:, 0] = [1, 2, 3, 4]
+    np.testing.assert_allclose(betweenness_centrality(star), [1.0, 0.0, 0.0, 0.0, 0.0])
+
+    # Two shortest paths between a and c (via b or d) share the credit
+    square = np.array([
+        [0, 1, 0, 1],
+        [1, 0, 1, 0],
+        [0, 1, 0, 1],
+        [1, 0, 1, 0],
+    ])
+    np.testing.assert_allclose(betweenness_centrality(square), [1 / 6] * 4)
+
+    assert betweenness_centrality(np.zeros((2, 2))).tolist() == [0.0, 0.0]